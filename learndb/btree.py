@@ -3,7 +3,7 @@ from __future__ import annotations
 """
 Contains the implementation of the btree
 """
-import sys
+import struct
 import logging
 
 from collections import deque
@@ -28,7 +28,6 @@ from .constants import (
     INTERNAL_NODE_HAS_RIGHT_CHILD_SIZE,
     INTERNAL_NODE_HAS_RIGHT_CHILD_OFFSET,
     INTERNAL_NODE_HEADER_SIZE,
-    INTERNAL_NODE_KEY_SIZE,
     INTERNAL_NODE_CHILD_SIZE,
     INTERNAL_NODE_CELL_SIZE,
     INTERNAL_NODE_MAX_CELLS,  # for debugging
@@ -58,6 +57,20 @@ from .pager import Pager
 from .serde import get_cell_key, get_cell_key_in_page, get_cell_size
 
 
+# compiled codec for the WORD (4 byte) integer fields that make up node
+# headers, cell ptrs, keys etc. `unpack_from` reads directly out of the
+# page at an offset- no intermediate slice- and both directions are a
+# single C call, vs an int.from_bytes/to_bytes per field access
+_word_struct = struct.Struct("=I")
+_unpack_word_from = _word_struct.unpack_from
+_pack_word = _word_struct.pack
+
+
+# precomputed indent strings for tree printing; avoids allocating a
+# fresh string per `depth_to_indent` call on deep/large trees
+_INDENTS = tuple(" " * (depth * 4) for depth in range(64))
+
+
 class TreeInsertResult(Enum):
     Success = auto()
     DuplicateKey = auto()
@@ -94,6 +107,8 @@ class Tree:
     level helpers that support find, insert, and delete.
     """
 
+    __slots__ = ("pager", "root_page_num")
+
     def __init__(self, pager: Pager, root_page_num: int):
         """
 
@@ -1551,9 +1566,7 @@ class Tree:
         offset = cellptr
         # 2.2. set block size
         block_size = len(cell)
-        block_size_value = block_size.to_bytes(
-            FREE_BLOCK_SIZE_SIZE, sys.byteorder
-        )  # encoded value
+        block_size_value = _pack_word(block_size)  # encoded value
         block_size_offset = offset + FREE_BLOCK_SIZE_OFFSET
         node[
             block_size_offset : block_size_offset + FREE_BLOCK_SIZE_SIZE
@@ -1568,11 +1581,11 @@ class Tree:
             # set next ptr to null
             node[
                 next_ptr_offset : next_ptr_offset + FREE_BLOCK_NEXT_BLOCK_SIZE
-            ] = NULLPTR.to_bytes(FREE_BLOCK_NEXT_BLOCK_SIZE, sys.byteorder)
+            ] = _pack_word(NULLPTR)
         else:
             # insert to head of list
             # make current head, new cell's next
-            next_ptr = head.to_bytes(FREE_BLOCK_NEXT_BLOCK_SIZE, sys.byteorder)
+            next_ptr = _pack_word(head)
             next_ptr_offset = offset + FREE_BLOCK_NEXT_BLOCK_OFFSET
             node[
                 next_ptr_offset : next_ptr_offset + FREE_BLOCK_NEXT_BLOCK_SIZE
@@ -1761,12 +1774,9 @@ class Tree:
         :param cell_num:
         :return:
         """
-        # read cellptr
+        # read cellptr; its value is the absolute offset of the cell on the page
         offset = LEAF_NODE_CELL_POINTER_START + (cell_num * LEAF_NODE_CELL_POINTER_SIZE)
-        cellptr = node[offset : offset + LEAF_NODE_CELL_POINTER_SIZE]
-        # cell_offset is the absolute offset on the page
-        cell_offset = int.from_bytes(cellptr, sys.byteorder)
-        return cell_offset
+        return _unpack_word_from(node, offset)[0]
 
     @staticmethod
     def leaf_node_cell_ptr_offset(cell_num: int):
@@ -1786,16 +1796,11 @@ class Tree:
         """
         return pointer to parent page_num
         """
-        value = node[
-            PARENT_POINTER_OFFSET : PARENT_POINTER_OFFSET + PARENT_POINTER_SIZE
-        ]
-        return int.from_bytes(value, sys.byteorder)
+        return _unpack_word_from(node, PARENT_POINTER_OFFSET)[0]
 
     @staticmethod
     def get_node_type(node: bytes) -> NodeType:
-        value = int.from_bytes(
-            node[NODE_TYPE_OFFSET : NODE_TYPE_OFFSET + NODE_TYPE_SIZE], sys.byteorder
-        )
+        value = _unpack_word_from(node, NODE_TYPE_OFFSET)[0]
         return NodeType(value)
 
     def get_node_max_key(self, node: bytes) -> Optional[int]:
@@ -1817,17 +1822,11 @@ class Tree:
 
     @staticmethod
     def is_node_root(node: bytes) -> bool:
-        value = node[IS_ROOT_OFFSET : IS_ROOT_OFFSET + IS_ROOT_SIZE]
-        int_val = int.from_bytes(value, sys.byteorder)
-        return bool(int_val)
+        return bool(_unpack_word_from(node, IS_ROOT_OFFSET)[0])
 
     @staticmethod
     def internal_node_num_keys(node: bytes) -> int:
-        value = node[
-            INTERNAL_NODE_NUM_KEYS_OFFSET : INTERNAL_NODE_NUM_KEYS_OFFSET
-            + INTERNAL_NODE_NUM_KEYS_SIZE
-        ]
-        return int.from_bytes(value, sys.byteorder)
+        return _unpack_word_from(node, INTERNAL_NODE_NUM_KEYS_OFFSET)[0]
 
     @staticmethod
     def internal_node_num_children(node: bytes) -> int:
@@ -1840,16 +1839,11 @@ class Tree:
     def internal_node_child(node: bytes, child_num: int) -> int:
         """return child ptr, i.e. page number"""
         offset = Tree.internal_node_child_offset(child_num)
-        value = node[offset : offset + INTERNAL_NODE_CHILD_SIZE]
-        return int.from_bytes(value, sys.byteorder)
+        return _unpack_word_from(node, offset)[0]
 
     @staticmethod
     def internal_node_right_child(node: bytes) -> int:
-        value = node[
-            INTERNAL_NODE_RIGHT_CHILD_OFFSET : INTERNAL_NODE_RIGHT_CHILD_OFFSET
-            + INTERNAL_NODE_RIGHT_CHILD_SIZE
-        ]
-        return int.from_bytes(value, sys.byteorder)
+        return _unpack_word_from(node, INTERNAL_NODE_RIGHT_CHILD_OFFSET)[0]
 
     @staticmethod
     def internal_node_cell(node: bytes, key_num: int) -> bytes:
@@ -1857,13 +1851,12 @@ class Tree:
         this does not work for right child"""
         assert key_num != INTERNAL_NODE_MAX_CELLS
         offset = Tree.internal_node_cell_offset(key_num)
-        return node[offset : offset + INTERNAL_NODE_CELL_SIZE]
+        return bytes(node[offset : offset + INTERNAL_NODE_CELL_SIZE])
 
     @staticmethod
     def internal_node_key(node: bytes, key_num: int) -> int:
         offset = Tree.internal_node_key_offset(key_num)
-        bin_num = node[offset : offset + INTERNAL_NODE_KEY_SIZE]
-        return int.from_bytes(bin_num, sys.byteorder)
+        return _unpack_word_from(node, offset)[0]
 
     @staticmethod
     def internal_node_children_starting_at(node: bytes, child_num: int) -> bytes:
@@ -1877,15 +1870,11 @@ class Tree:
         offset = Tree.internal_node_cell_offset(child_num)
         num_keys = Tree.internal_node_num_keys(node)
         num_keys_to_shift = num_keys - child_num
-        return node[offset : offset + num_keys_to_shift * INTERNAL_NODE_CELL_SIZE]
+        return bytes(node[offset : offset + num_keys_to_shift * INTERNAL_NODE_CELL_SIZE])
 
     @staticmethod
     def internal_node_has_right_child(node: bytes) -> bool:
-        value = node[
-            INTERNAL_NODE_HAS_RIGHT_CHILD_OFFSET : INTERNAL_NODE_HAS_RIGHT_CHILD_OFFSET
-            + INTERNAL_NODE_HAS_RIGHT_CHILD_SIZE
-        ]
-        return bool.from_bytes(value, sys.byteorder)
+        return bool(_unpack_word_from(node, INTERNAL_NODE_HAS_RIGHT_CHILD_OFFSET)[0])
 
     @staticmethod
     def leaf_node_cell(node: bytes, cell_num: int) -> bytes:
@@ -1900,7 +1889,7 @@ class Tree:
         cellptr = Tree.leaf_node_cellptr(node, cell_num)
         # get cell size
         cell_size = get_cell_size(node, cellptr)
-        return node[cellptr : cellptr + cell_size]
+        return bytes(node[cellptr : cellptr + cell_size])
 
     @staticmethod
     def leaf_node_cell_size(node: bytes, cell_num: int) -> int:
@@ -1935,11 +1924,7 @@ class Tree:
         of the tree, while page is in the domain of storage.
         Using the same naming convention of `prop_name` for getter and `set_prop_name` for setter
         """
-        bin_num = node[
-            LEAF_NODE_NUM_CELLS_OFFSET : LEAF_NODE_NUM_CELLS_OFFSET
-            + LEAF_NODE_NUM_CELLS_SIZE
-        ]
-        return int.from_bytes(bin_num, sys.byteorder)
+        return _unpack_word_from(node, LEAF_NODE_NUM_CELLS_OFFSET)[0]
 
     @staticmethod
     def leaf_node_key(node: bytes, cell_num: int) -> int:
@@ -1965,8 +1950,7 @@ class Tree:
         :return:
         """
         offset = LEAF_NODE_CELL_POINTER_START + cell_num * LEAF_NODE_CELL_POINTER_SIZE
-        binstr = node[offset : offset + LEAF_NODE_CELL_POINTER_SIZE]
-        return int.from_bytes(binstr, sys.byteorder)
+        return _unpack_word_from(node, offset)[0]
 
     @staticmethod
     def leaf_node_cellptrs_starting_at(node: bytes, cell_num: int) -> bytes:
@@ -1984,7 +1968,7 @@ class Tree:
         num_cells = Tree.leaf_node_num_cells(node)
         num_cellptrs_after_cell_num = num_cells - cell_num
         end = start + num_cellptrs_after_cell_num * LEAF_NODE_CELL_POINTER_SIZE
-        return node[start:end]
+        return bytes(node[start:end])
 
     @staticmethod
     def leaf_node_alloc_ptr(node: bytes) -> int:
@@ -1992,11 +1976,7 @@ class Tree:
         :param node:
         :return: the value of the alloc ptr, i.e. the abs offset of the first byte that can be allocated
         """
-        bstring = node[
-            LEAF_NODE_ALLOC_POINTER_OFFSET : LEAF_NODE_ALLOC_POINTER_OFFSET
-            + LEAF_NODE_ALLOC_POINTER_SIZE
-        ]
-        return int.from_bytes(bstring, sys.byteorder)
+        return _unpack_word_from(node, LEAF_NODE_ALLOC_POINTER_OFFSET)[0]
 
     @staticmethod
     def leaf_node_unallocated_offset(node: bytes) -> int:
@@ -2030,11 +2010,7 @@ class Tree:
         :param node:
         :return:
         """
-        binvalue = node[
-            LEAF_NODE_TOTAL_FREE_LIST_SPACE_OFFSET : LEAF_NODE_TOTAL_FREE_LIST_SPACE_OFFSET
-            + LEAF_NODE_TOTAL_FREE_LIST_SPACE_SIZE
-        ]
-        return int.from_bytes(binvalue, sys.byteorder)
+        return _unpack_word_from(node, LEAF_NODE_TOTAL_FREE_LIST_SPACE_OFFSET)[0]
 
     @staticmethod
     def leaf_node_free_list_head(node: bytes) -> int:
@@ -2044,11 +2020,7 @@ class Tree:
         :param node:
         :return:
         """
-        binval = node[
-            LEAF_NODE_FREE_LIST_HEAD_POINTER_OFFSET : LEAF_NODE_FREE_LIST_HEAD_POINTER_OFFSET
-            + LEAF_NODE_FREE_LIST_HEAD_POINTER_SIZE
-        ]
-        return int.from_bytes(binval, sys.byteorder)
+        return _unpack_word_from(node, LEAF_NODE_FREE_LIST_HEAD_POINTER_OFFSET)[0]
 
     @staticmethod
     def free_block_size(node: bytes, free_block_offset: int) -> int:
@@ -2059,8 +2031,7 @@ class Tree:
         :return:
         """
         offset = free_block_offset + FREE_BLOCK_SIZE_OFFSET
-        binval = node[offset : offset + FREE_BLOCK_SIZE_SIZE]
-        return int.from_bytes(binval, sys.byteorder)
+        return _unpack_word_from(node, offset)[0]
 
     @staticmethod
     def free_block_next_free(node: bytes, free_block_offset: int) -> int:
@@ -2068,26 +2039,23 @@ class Tree:
         get next free block pointed to by block at `free_block_offset`
         """
         offset = free_block_offset + FREE_BLOCK_NEXT_BLOCK_OFFSET
-        binval = node[offset : offset + FREE_BLOCK_NEXT_BLOCK_SIZE]
-        return int.from_bytes(binval, sys.byteorder)
+        return _unpack_word_from(node, offset)[0]
 
     @staticmethod
     def set_parent_page_num(node: bytes, page_num: int):
-        value = page_num.to_bytes(PARENT_POINTER_SIZE, sys.byteorder)
+        value = _pack_word(page_num)
         node[
             PARENT_POINTER_OFFSET : PARENT_POINTER_OFFSET + PARENT_POINTER_SIZE
         ] = value
 
     @staticmethod
     def set_node_is_root(node: bytes, is_root: bool):
-        value = is_root.to_bytes(IS_ROOT_SIZE, sys.byteorder)
+        value = _pack_word(is_root)
         node[IS_ROOT_OFFSET : IS_ROOT_OFFSET + IS_ROOT_SIZE] = value
 
     @staticmethod
     def set_internal_node_has_right_child(node: bytes, has_right_child: bool):
-        value = has_right_child.to_bytes(
-            INTERNAL_NODE_HAS_RIGHT_CHILD_SIZE, sys.byteorder
-        )
+        value = _pack_word(has_right_child)
         node[
             INTERNAL_NODE_HAS_RIGHT_CHILD_OFFSET : INTERNAL_NODE_HAS_RIGHT_CHILD_OFFSET
             + INTERNAL_NODE_HAS_RIGHT_CHILD_SIZE
@@ -2095,7 +2063,7 @@ class Tree:
 
     @staticmethod
     def set_node_type(node: bytes, node_type: NodeType):
-        bits = node_type.value.to_bytes(NODE_TYPE_SIZE, sys.byteorder)
+        bits = _pack_word(node_type.value)
         node[NODE_TYPE_OFFSET : NODE_TYPE_OFFSET + NODE_TYPE_SIZE] = bits
 
     @staticmethod
@@ -2119,7 +2087,7 @@ class Tree:
             child_page_num < 100
         ), f"attempting to set very large page num {child_page_num}"
         offset = Tree.internal_node_child_offset(child_num)
-        value = child_page_num.to_bytes(INTERNAL_NODE_CHILD_SIZE, sys.byteorder)
+        value = _pack_word(child_page_num)
         node[offset : offset + INTERNAL_NODE_CHILD_SIZE] = value
 
     @staticmethod
@@ -2143,12 +2111,12 @@ class Tree:
     @staticmethod
     def set_internal_node_key(node: bytes, child_num: int, key: int):
         offset = Tree.internal_node_key_offset(child_num)
-        value = key.to_bytes(INTERNAL_NODE_CHILD_SIZE, sys.byteorder)
+        value = _pack_word(key)
         node[offset : offset + INTERNAL_NODE_NUM_KEYS_SIZE] = value
 
     @staticmethod
     def set_internal_node_num_keys(node: bytes, num_keys: int):
-        value = num_keys.to_bytes(INTERNAL_NODE_NUM_KEYS_SIZE, sys.byteorder)
+        value = _pack_word(num_keys)
         node[
             INTERNAL_NODE_NUM_KEYS_OFFSET : INTERNAL_NODE_NUM_KEYS_OFFSET
             + INTERNAL_NODE_NUM_KEYS_SIZE
@@ -2176,9 +2144,7 @@ class Tree:
         assert (
             right_child_page_num < 100
         ), f"attempting to set very large page num {right_child_page_num}"
-        value = right_child_page_num.to_bytes(
-            INTERNAL_NODE_RIGHT_CHILD_SIZE, sys.byteorder
-        )
+        value = _pack_word(right_child_page_num)
         node[
             INTERNAL_NODE_RIGHT_CHILD_OFFSET : INTERNAL_NODE_RIGHT_CHILD_OFFSET
             + INTERNAL_NODE_RIGHT_CHILD_SIZE
@@ -2187,7 +2153,7 @@ class Tree:
     @staticmethod
     def set_leaf_node_key(node: bytes, cell_num: int, key: int):
         offset = Tree.leaf_node_key_offset(cell_num)
-        value = key.to_bytes(LEAF_NODE_KEY_SIZE, sys.byteorder)
+        value = _pack_word(key)
         node[offset : offset + LEAF_NODE_KEY_SIZE] = value
 
     @staticmethod
@@ -2198,7 +2164,7 @@ class Tree:
         :param alloc_ptr:
         :return:
         """
-        value = alloc_ptr.to_bytes(LEAF_NODE_ALLOC_POINTER_SIZE, sys.byteorder)
+        value = _pack_word(alloc_ptr)
         node[
             LEAF_NODE_ALLOC_POINTER_OFFSET : LEAF_NODE_ALLOC_POINTER_OFFSET
             + LEAF_NODE_ALLOC_POINTER_SIZE
@@ -2215,7 +2181,7 @@ class Tree:
         """
         offset = LEAF_NODE_CELL_POINTER_START + LEAF_NODE_CELL_POINTER_SIZE * cell_num
         assert cellptr > 0, "cellptr must be a positive offset"
-        cbytes = cellptr.to_bytes(LEAF_NODE_CELL_POINTER_SIZE, sys.byteorder)
+        cbytes = _pack_word(cellptr)
         node[offset : offset + len(cbytes)] = cbytes
 
     @staticmethod
@@ -2233,7 +2199,7 @@ class Tree:
         """
         write num of node cells: encode to int
         """
-        value = num_cells.to_bytes(LEAF_NODE_NUM_CELLS_SIZE, sys.byteorder)
+        value = _pack_word(num_cells)
         node[
             LEAF_NODE_NUM_CELLS_OFFSET : LEAF_NODE_NUM_CELLS_OFFSET
             + LEAF_NODE_NUM_CELLS_SIZE
@@ -2257,7 +2223,7 @@ class Tree:
         :param head: offset to head of free list, i.e. free node location
         :return:
         """
-        value = head.to_bytes(LEAF_NODE_FREE_LIST_HEAD_POINTER_SIZE, sys.byteorder)
+        value = _pack_word(head)
         node[
             LEAF_NODE_FREE_LIST_HEAD_POINTER_OFFSET : LEAF_NODE_FREE_LIST_HEAD_POINTER_OFFSET
             + LEAF_NODE_FREE_LIST_HEAD_POINTER_SIZE
@@ -2265,9 +2231,7 @@ class Tree:
 
     @staticmethod
     def set_leaf_node_total_free_list_space(node: bytes, total_free_space: int) -> int:
-        value = total_free_space.to_bytes(
-            LEAF_NODE_TOTAL_FREE_LIST_SPACE_SIZE, sys.byteorder
-        )
+        value = _pack_word(total_free_space)
         node[
             LEAF_NODE_TOTAL_FREE_LIST_SPACE_OFFSET : LEAF_NODE_TOTAL_FREE_LIST_SPACE_OFFSET
             + LEAF_NODE_TOTAL_FREE_LIST_SPACE_SIZE
@@ -2282,6 +2246,8 @@ class Tree:
         :param depth:
         :return:
         """
+        if depth < len(_INDENTS):
+            return _INDENTS[depth]
         return " " * (depth * 4)
 
     def print_nodes(self, nodes: dict):
@@ -1,4 +1,3 @@
-from .constants import INTERNAL_NODE_MAX_CELLS
 from .btree import Tree, NodeType
 from .pager import Pager
 
@@ -10,17 +9,37 @@ class Cursor:
     A cursor exposes an interface to read, insert and delete rows.
     """
 
+    __slots__ = (
+        "tree",
+        "pager",
+        "page_num",
+        "cell_num",
+        "node",
+        "end_of_table",
+        "ancestors",
+    )
+
     def __init__(self, pager: Pager, tree: Tree):
         self.tree = tree
         self.pager = pager
         self.page_num = tree.root_page_num
         self.cell_num = 0
+        # page the cursor is positioned on; kept in sync with page_num
+        # so the hot read path (get_cell/advance) doesn't round-trip
+        # through the pager per call
+        self.node = None
         self.end_of_table = False
+        # descent path from root to current leaf; stack of
+        # (page_num, child_num) of each internal node on the path, where
+        # child_num is the position of the taken child (inner children
+        # are at 0..num_keys-1, the right child at num_keys)
+        self.ancestors = []
         self.first_leaf()
 
     def first_leaf(self):
         """
-        set cursor location to left-most/first leaf
+        set cursor location to left-most/first leaf, recording the
+        descent path onto `self.ancestors`
         """
         # start with root and descend until we hit left most leaf
         node = self.pager.get_page(self.page_num)
@@ -33,11 +52,13 @@ class Cursor:
                 child_page_num = Tree.internal_node_right_child(node)
             else:
                 child_page_num = Tree.internal_node_child(node, 0)
+            self.ancestors.append((self.page_num, 0))
             self.page_num = child_page_num
             node = self.pager.get_page(child_page_num)
 
         self.cell_num = 0
         # node must be leaf node
+        self.node = node
         self.end_of_table = Tree.leaf_node_num_cells(node) == 0
 
     def get_cell(self) -> bytes:
@@ -45,9 +66,7 @@ class Cursor:
         return cell pointed by cursor
         :return:
         """
-        node = self.pager.get_page(self.page_num)
-        cell = Tree.leaf_node_cell(node, self.cell_num)
-        return cell
+        return Tree.leaf_node_cell(self.node, self.cell_num)
 
     def next_leaf(self):
         """
@@ -57,36 +76,36 @@ class Cursor:
         NOTE: if starting from an internal node, to get to a leaf use `first_leaf` method
         :return:
         """
-        # starting point
-        node = self.pager.get_page(self.page_num)
-        if Tree.is_node_root(node) is True:
-            # there is nothing
-            self.end_of_table = True
-            return
-
-        node_max_value = self.tree.get_node_max_key(node)
-        assert node_max_value is not None
+        # walk up the recorded descent path to the nearest ancestor with
+        # an unconsumed child, then descend to the leftmost leaf under it.
+        # NOTE: this makes a full scan O(1) amortized per advance; the
+        # previous implementation re-searched each parent by the node's
+        # max key (an O(tree-height) walk with key comparisons, per leaf)
+        while self.ancestors:
+            parent_page_num, child_num = self.ancestors.pop()
+            parent = self.pager.get_page(parent_page_num)
+            num_keys = Tree.internal_node_num_keys(parent)
+            if child_num >= num_keys:
+                # taken child was the right child, i.e. all of this
+                # node's children are consumed; go up another level
+                continue
 
-        parent_page_num = Tree.get_parent_page_num(node)
-        # check if current page, i.e. self.page_num is right most child of it's parent
-        parent = self.pager.get_page(parent_page_num)
-        child_num = self.tree.internal_node_find(parent_page_num, node_max_value)
-        if child_num == INTERNAL_NODE_MAX_CELLS:
-            # this is the right child; thus all children have been consumed
-            # go up another level
-            self.page_num = parent_page_num
-            self.next_leaf()
-        else:
             # there is at least one child to be consumed
             # find the next child
-            if child_num == Tree.internal_node_num_keys(parent) - 1:
+            child_num += 1
+            if child_num == num_keys:
                 # next child is the right child
                 next_child = Tree.internal_node_right_child(parent)
             else:
-                next_child = Tree.internal_node_child(parent, child_num + 1)
+                next_child = Tree.internal_node_child(parent, child_num)
+            self.ancestors.append((parent_page_num, child_num))
             self.page_num = next_child
             # now find first leaf in next child
             self.first_leaf()
+            return
+
+        # no ancestor has unconsumed children- the scan is complete
+        self.end_of_table = True
 
     def advance(self):
         """
@@ -97,10 +116,9 @@ class Cursor:
         """
         # advance always start at leaf node and ends at a leaf node;
         # starting at or ending at an internal node means the cursor is inconsistent
-        node = self.pager.get_page(self.page_num)
         # we are currently on the last cell in the node
         # go to the next node if it exists
-        if self.cell_num >= Tree.leaf_node_num_cells(node) - 1:
+        if self.cell_num >= Tree.leaf_node_num_cells(self.node) - 1:
             self.next_leaf()
         else:
             self.cell_num += 1
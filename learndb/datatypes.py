@@ -2,13 +2,24 @@
 Database, i.e. storage layer datatypes, as distinct from: 1) parsed AST datatype, 2) execution datatype (i.e. impl
 language datatype)
 """
-import sys
 import struct
 from abc import ABCMeta
 from typing import Any, Type
 
 from .constants import INTEGER_SIZE, REAL_SIZE
 
+# precompiled (de)serializers for the fixed-length types; a Struct
+# instance parses its format string once, so the per-value pack/unpack
+# is a single C call. These are hot- every cell read/write round-trips
+# several integers (sizes, serial types, keys) through these.
+# NOTE: '=' means native byteorder, matching the to_bytes(.., sys.byteorder)
+# encoding previously used for integers; 'I' (unsigned) likewise matches
+# the unsigned to_bytes encoding.
+assert INTEGER_SIZE == struct.calcsize("=I")
+_integer_struct = struct.Struct("=I")
+_real_struct = struct.Struct("=f")
+_boolean_struct = struct.Struct("=?")
+
 
 class DataType:
     """
@@ -72,12 +83,11 @@ class Integer(DataType):
 
     @staticmethod
     def serialize(value: int) -> bytes:
-        # print("In integer::serialize")
-        return value.to_bytes(INTEGER_SIZE, sys.byteorder)
+        return _integer_struct.pack(value)
 
     @staticmethod
     def deserialize(bstring: bytes) -> int:
-        return int.from_bytes(bstring, sys.byteorder)
+        return _integer_struct.unpack(bstring)[0]
 
     @staticmethod
     def is_valid_term(term) -> bool:
@@ -103,7 +113,7 @@ class Real(DataType):
         :return:
         """
         # encodes float according to native byteorder ('=')
-        return struct.pack("=f", value)
+        return _real_struct.pack(value)
 
     @staticmethod
     def deserialize(bstring) -> float:
@@ -111,7 +121,7 @@ class Real(DataType):
         :param value:
         :return:
         """
-        tpl = struct.unpack("=f", bstring)
+        tpl = _real_struct.unpack(bstring)
         return tpl[0]
 
     @staticmethod
@@ -154,11 +164,11 @@ class Boolean(DataType):
 
     @staticmethod
     def serialize(value: bool):
-        return struct.pack("=?", value)
+        return _boolean_struct.pack(value)
 
     @staticmethod
     def deserialize(bstring: bytes):
-        tpl = struct.unpack("=?", bstring)
+        tpl = _boolean_struct.unpack(bstring)
         return tpl[0]
 
     @staticmethod
@@ -129,42 +129,61 @@ class LearnDB:
 
     def do_meta_command(self, command: str) -> Response:
         """
-        handle execution of meta command
+        handle execution of meta command; dispatches on the first token
+        (the command name) via a handler table
         :param command:
         :param db:
         :return:
         """
-        if command == ".quit":
-            print("goodbye")
-            self.close()
-            sys.exit(EXIT_SUCCESS)
-        elif command.startswith(".btree"):
-            # .btree expects table-name
-            splits = command.split(" ")
-            if len(splits) != 2:
-                print("Invalid argument to .btree| Usage: > .btree <table-name>")
-                return Response(False, status=MetaCommandResult.InvalidArgument)
-            tree_name = splits[1]
-            print("Printing tree" + "-" * 50)
-            self.virtual_machine.state_manager.print_tree(tree_name)
-            print("Finished printing tree" + "-" * 50)
-            return Response(True, status=MetaCommandResult.Success)
-        elif command == ".validate":
-            print("Validating tree....")
-            splits = command.split(" ")
-            if len(splits) != 2:
-                print("Invalid argument to .validate| Usage: > .validate <table-name>")
-                return Response(False, status=MetaCommandResult.InvalidArgument)
-            tree_name = splits[1]
-            self.virtual_machine.state_manager.validate_tree(tree_name)
-            print("Validation succeeded.......")
-            return Response(True, status=MetaCommandResult.Success)
-        elif command == ".nuke":
-            self.nuke_dbfile()
-        elif command == ".help":
-            print(USAGE)
-            return Response(True, status=MetaCommandResult.Success)
-        return Response(False, status=MetaCommandResult.UnrecognizedCommand)
+        splits = command.split(" ")
+        handler = self._meta_command_handlers.get(splits[0])
+        if handler is None:
+            return Response(False, status=MetaCommandResult.UnrecognizedCommand)
+        return handler(self, splits)
+
+    def meta_quit(self, splits: List[str]) -> Response:
+        print("goodbye")
+        self.close()
+        sys.exit(EXIT_SUCCESS)
+
+    def meta_btree(self, splits: List[str]) -> Response:
+        # .btree expects table-name
+        if len(splits) != 2:
+            print("Invalid argument to .btree| Usage: > .btree <table-name>")
+            return Response(False, status=MetaCommandResult.InvalidArgument)
+        tree_name = splits[1]
+        print("Printing tree" + "-" * 50)
+        self.virtual_machine.state_manager.print_tree(tree_name)
+        print("Finished printing tree" + "-" * 50)
+        return Response(True, status=MetaCommandResult.Success)
+
+    def meta_validate(self, splits: List[str]) -> Response:
+        print("Validating tree....")
+        if len(splits) != 2:
+            print("Invalid argument to .validate| Usage: > .validate <table-name>")
+            return Response(False, status=MetaCommandResult.InvalidArgument)
+        tree_name = splits[1]
+        self.virtual_machine.state_manager.validate_tree(tree_name)
+        print("Validation succeeded.......")
+        return Response(True, status=MetaCommandResult.Success)
+
+    def meta_nuke(self, splits: List[str]) -> Response:
+        self.nuke_dbfile()
+        return Response(True, status=MetaCommandResult.Success)
+
+    def meta_help(self, splits: List[str]) -> Response:
+        print(USAGE)
+        return Response(True, status=MetaCommandResult.Success)
+
+    # command name -> handler; a single dict probe replaces the
+    # per-command string compare chain
+    _meta_command_handlers = {
+        ".quit": meta_quit,
+        ".btree": meta_btree,
+        ".validate": meta_validate,
+        ".nuke": meta_nuke,
+        ".help": meta_help,
+    }
 
     @staticmethod
     def prepare_statement(command) -> Response:
@@ -242,8 +261,14 @@ def repl(db_filepath: str = DB_FILE):
         # get output pipe
         pipe = db.get_pipe()
 
+        # drain pipe into one buffer and emit it with a single write,
+        # instead of a write per row
+        msgs = []
         while pipe.has_msgs():
-            print(pipe.read())
+            msgs.append(str(pipe.read()))
+        if msgs:
+            msgs.append("")
+            sys.stdout.write("\n".join(msgs))
 
 
 def run_file(input_filepath: str, db_filepath: str = DB_FILE) -> Response:
@@ -268,8 +293,13 @@ def run_file(input_filepath: str, db_filepath: str = DB_FILE) -> Response:
     # get output pipe
     pipe = db.get_pipe()
 
+    # emit all rows with a single write- see note in `repl`
+    msgs = []
     while pipe.has_msgs():
-        print(pipe.read())
+        msgs.append(str(pipe.read()))
+    if msgs:
+        msgs.append("")
+        sys.stdout.write("\n".join(msgs))
 
     db.close()
 
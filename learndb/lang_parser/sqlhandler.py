@@ -1,6 +1,8 @@
 from __future__ import annotations
 import logging
 
+from functools import lru_cache
+
 from lark import Lark
 from lark.exceptions import UnexpectedInput  # root of all lark exceptions
 
@@ -11,6 +13,18 @@ from .grammar import GRAMMAR
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _build_parser(grammar: str, start: str = "program") -> Lark:
+    """
+    Construct a Lark parser for `grammar`, memoized on the grammar text.
+
+    Grammar analysis is by far the most expensive part of parser
+    construction, and a new SqlFrontEnd is created per statement; caching
+    amortizes that one-time cost across all parses in the process.
+    """
+    return Lark(grammar, parser="earley", start=start, debug=True)
+
+
 class SqlFrontEnd:
     """
     Parser for learndb lang, based on lark definition
@@ -29,7 +43,7 @@ class SqlFrontEnd:
         self.debug_mode = debug_mode
 
     def _init(self):
-        self.parser = Lark(GRAMMAR, parser="earley", start="program", debug=True)
+        self.parser = _build_parser(GRAMMAR)
 
     def error_summary(self):
         if self.exc is not None:
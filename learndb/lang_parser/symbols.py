@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import abc
+import dataclasses
 
 from collections import deque
 from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum, auto
-from lark import Transformer, Tree, ast_utils, Token
+from lark import Transformer, Tree, ast_utils, Token, v_args
 from typing import Any, List, Union, Optional, Type, Tuple
 
 
@@ -78,12 +78,40 @@ class Symbol(ast_utils.Ast):
     The root of AST hierarchy
     """
 
+    # NOTE: the slot declarations on Symbol subclasses exist to drive
+    # _get_child_fields (and to pin each class's field set); they do NOT
+    # drop the per-instance __dict__, because the lark ast_utils.Ast
+    # base carries no __slots__ of its own
+    __slots__ = ()
+
     def accept(self, visitor: Visitor) -> Any:
         return visitor.visit(self)
 
     def __hash__(self):
         return self.__class__.__name__ + str(self.__dict__)
 
+    @classmethod
+    def _get_child_fields(cls) -> Tuple[str, ...]:
+        """
+        Return the names of fields that may contain child nodes.
+        The tuple is computed once per class and cached, so repeated
+        traversals avoid a reflective `dir()` scan (which returns every
+        inherited name, incl. methods) per node.
+        """
+        fields = cls.__dict__.get("_child_fields")
+        if fields is None:
+            if dataclasses.is_dataclass(cls):
+                fields = tuple(f.name for f in dataclasses.fields(cls))
+            else:
+                # hand-written __init__; fields live in __slots__ up the mro
+                fields = tuple(
+                    name
+                    for klass in cls.__mro__
+                    for name in klass.__dict__.get("__slots__", ())
+                )
+            cls._child_fields = fields
+        return fields
+
     def find_descendents(
         self, descendent_type: Union[Type[Symbol], Tuple[Type[Symbol]]]
     ) -> List:
@@ -102,7 +130,7 @@ class Symbol(ast_utils.Ast):
             if isinstance(node, descendent_type):
                 matches.append(node)
             # iterate over children
-            for attr_name in dir(node):
+            for attr_name in node._get_child_fields():
                 attr = getattr(node, attr_name)
                 if isinstance(attr, Symbol):
                     queue.append(attr)
@@ -118,6 +146,8 @@ class Symbol(ast_utils.Ast):
 
 
 class CreateStmnt(Symbol):
+    __slots__ = ("table_name", "columns")
+
     def __init__(self, table_name: Tree = None, column_def_list: Tree = None):
         self.table_name = table_name
         self.columns = column_def_list
@@ -127,18 +157,24 @@ class CreateStmnt(Symbol):
         """
         Ensure one and only one primary key
         """
-        pkey_count = len([col for col in self.columns if col.is_primary_key])
-        if pkey_count != 1:
-            raise ValueError(f"Expected 1 primary key received {pkey_count}")
+        pkey_count = 0
+        for col in self.columns:
+            if col.is_primary_key:
+                pkey_count += 1
+                if pkey_count > 1:
+                    # no need to scan the rest of the columns
+                    raise ValueError("Expected 1 primary key received more than 1")
+        if pkey_count == 0:
+            raise ValueError("Expected 1 primary key received 0")
 
     def __repr__(self):
         return str(self)
 
     def __str__(self):
-        return f"{self.__class__.__name__}({self.__dict__})"
+        return f"{self.__class__.__name__}(table_name: {self.table_name}, columns: {self.columns})"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class DropStmnt(Symbol):
     table_name: TableName
 
@@ -147,6 +183,8 @@ class DropStmnt(Symbol):
 
 
 class ColumnDef(Symbol):
+    __slots__ = ("column_name", "datatype", "is_primary_key", "is_nullable")
+
     def __init__(
         self,
         column_name: Tree = None,
@@ -155,10 +193,12 @@ class ColumnDef(Symbol):
     ):
         self.column_name = column_name
         self.datatype = datatype
-        self.is_primary_key = column_modifier == ColumnModifier.PrimaryKey
+        # enum members are singletons, so identity compare; and derive
+        # both flags from a single primary-key check
+        is_primary_key = column_modifier is ColumnModifier.PrimaryKey
+        self.is_primary_key = is_primary_key
         self.is_nullable = (
-            column_modifier != ColumnModifier.NotNull
-            and column_modifier != ColumnModifier.PrimaryKey
+            not is_primary_key and column_modifier is not ColumnModifier.NotNull
         )
 
     def __repr__(self):
@@ -168,7 +208,7 @@ class ColumnDef(Symbol):
         return f"Column(name: {self.column_name}, datatype: {self.datatype}, pkey: {self.is_primary_key}, nullable: {self.is_nullable})"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Comparison(Symbol):
     left_op: Any
     right_op: Any
@@ -176,7 +216,7 @@ class Comparison(Symbol):
 
 
 # select stmnt
-@dataclass
+@dataclass(slots=True, eq=False)
 class SelectStmnt(Symbol):
     select_clause: Any
     # all other clauses depend on from clause and hence are
@@ -190,12 +230,21 @@ class SelectStmnt(Symbol):
 # select stmnt helpers
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SelectClause(Symbol):
     selectables: List[Any]
 
 
 class FromClause(Symbol):
+    __slots__ = (
+        "source",
+        "where_clause",
+        "group_by_clause",
+        "having_clause",
+        "order_by_clause",
+        "limit_clause",
+    )
+
     def __init__(
         self,
         source,
@@ -214,32 +263,55 @@ class FromClause(Symbol):
         self.limit_clause = limit_clause
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SingleSource(Symbol):
     table_name: TableName
     table_alias: Any = None
 
 
 # wrap around from source
-@dataclass
+@dataclass(slots=True, eq=False)
 class FromSource(Symbol):
     source: Any
 
 
-class UnconditionedJoin(Symbol):
+# maps join_modifier grammar rule name to join type
+_JOIN_MODIFIER_TO_TYPE = {
+    "inner": JoinType.Inner,
+    "left_outer": JoinType.LeftOuter,
+    "right_outer": JoinType.RightOuter,
+    "full_outer": JoinType.FullOuter,
+}
+
+
+class Joining:
+    """
+    Marker base for join sources. Subclassed directly (rather than via
+    abc registration) so isinstance checks take the native mro path
+    instead of ABCMeta.__instancecheck__.
+    """
+
+    __slots__ = ()
+
+
+class UnconditionedJoin(Symbol, Joining):
+    __slots__ = ("left_source", "right_source", "join_type")
+
     def __init__(self, left_source, right_source):
         self.left_source = left_source
         self.right_source = right_source
         self.join_type = JoinType.Cross
 
 
-class ConditionedJoin(Symbol):
+class ConditionedJoin(Symbol, Joining):
     """
     AST classes are responsible for translating parse tree matched rules
     to more intuitive properties, that the VM can operate on.
     Additionally, they should enforce any local constraints, e.g. 1 primary key
     """
 
+    __slots__ = ("left_source", "right_source", "condition", "join_type")
+
     def __init__(self, left_source, right_source, condition, join_modifier=None):
         self.left_source = left_source
         self.right_source = right_source
@@ -252,39 +324,25 @@ class ConditionedJoin(Symbol):
         if join_modifier is None:
             return JoinType.Inner
         modifier = join_modifier.children[0].data  # not sure why it's a list
-        modifier = modifier.lower()
-        if modifier == "inner":
-            return JoinType.Inner
-        elif modifier == "left_outer":
-            return JoinType.LeftOuter
-        elif modifier == "right_outer":
-            return JoinType.RightOuter
-        else:
-            assert modifier == "full_outer"
-            return JoinType.FullOuter
+        join_type = _JOIN_MODIFIER_TO_TYPE.get(modifier)
+        if join_type is None:
+            # grammar rule names should already be lowercase; retry lowered
+            join_type = _JOIN_MODIFIER_TO_TYPE[modifier.lower()]
+        return join_type
 
 
-class Joining(abc.ABC):
-    pass
-
-
-# makes (Un)ConditionedJoin a subclass of Joining
-Joining.register(ConditionedJoin)
-Joining.register(UnconditionedJoin)
-
-
-@dataclass
+@dataclass(slots=True, eq=False)
 class WhereClause(Symbol):
     condition: Any  # OrClause
 
 
 # root of expr hierarchy
-@dataclass
+@dataclass(slots=True, eq=False)
 class Expr(Symbol):
     expr: Any
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class OrClause(Symbol):
     and_clauses: Any
 
@@ -292,7 +350,7 @@ class OrClause(Symbol):
         self.and_clauses.append(and_clause)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class AndClause(Symbol):
     predicates: List[Any]
 
@@ -300,62 +358,62 @@ class AndClause(Symbol):
         self.predicates.append(predicate)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class GroupByClause(Symbol):
     columns: List[Any]
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class HavingClause(Symbol):
     condition: Any
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class OrderByClause(Symbol):
     columns: List[OrderedColumn]
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class OrderedColumn(Symbol):
     column: ColumnName
     qualifier: OrderingQualifier
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class LimitClause(Symbol):
     limit: int
     offset: Any = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class InsertStmnt(Symbol):
     table_name: Any
     column_name_list: ColumnNameList
     value_list: ValueList
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ColumnNameList(Symbol):
     names: List[ColumnName]
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ValueList(Symbol):
     values: List[Any]
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class DeleteStmnt(Symbol):
     table_name: Any
     where_condition: Any = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Program(Symbol):
     statements: list
 
 
-@dataclass
+@dataclass(slots=True)
 class TableName(Symbol):
     table_name: str
 
@@ -366,7 +424,7 @@ class TableName(Symbol):
         return hasattr(other, "table_name") and self.table_name == other.table_name
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ColumnName(Symbol):
     """
     Represents a column named like: 1) tbl.cola or 2) cola
@@ -391,25 +449,44 @@ class ColumnName(Symbol):
         return self.name.split(".")[-1]
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class FuncCall(Symbol):
     name: str
     args: List
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Literal(Symbol):
     value: Any
     type: SymbolicDataType
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class BinaryArithmeticOperation(Symbol):
     operator: ArithmeticOp
     operand1: Any
     operand2: Any
 
 
+# maps datatype token (lowered) to symbolic datatype
+_DATATYPE_MAP = {
+    "integer": SymbolicDataType.Integer,
+    "real": SymbolicDataType.Real,
+    "text": SymbolicDataType.Text,
+    "blob": SymbolicDataType.Blob,
+}
+
+# maps type of optional from-clause component to the FromClause
+# attribute it should be stored on; avoids an isinstance ladder per arg
+_FROM_CLAUSE_SETTERS = {
+    WhereClause: "where_clause",
+    GroupByClause: "group_by_clause",
+    HavingClause: "having_clause",
+    OrderByClause: "order_by_clause",
+    LimitClause: "limit_clause",
+}
+
+
 class ToAst(Transformer):
     """
     Convert parse tree to AST.
@@ -463,53 +540,34 @@ class ToAst(Transformer):
         return SelectClause(args)
 
     def from_clause(self, args) -> FromClause:
-        # setup iteration over args
-        args_iter = iter(args)
-        count = len(args)
-        assert count >= 1
-
-        arg = next(args_iter)
-        count -= 1
-        # assert isinstance(arg, FromSource)
+        assert len(args) >= 1
+
+        arg = args[0]
         assert isinstance(arg, SingleSource) or isinstance(arg, Joining)
 
-        # unwrap any nested FromSource
-        fclause = FromClause(arg)
-        fclause.source = FromSource(fclause.source)
-
-        if count == 0:
-            return fclause
-
-        while count > 0:
-            arg = next(args_iter)
-            count -= 1
-            if isinstance(arg, WhereClause):
-                fclause.where_clause = arg
-            elif isinstance(arg, GroupByClause):
-                fclause.group_by_clause = arg
-            elif isinstance(arg, HavingClause):
-                fclause.having_clause = arg
-            elif isinstance(arg, LimitClause):
-                fclause.limit_clause = arg
-            elif isinstance(arg, OrderByClause):
-                fclause.order_by_clause = arg
+        # wrap source in FromSource
+        fclause = FromClause(FromSource(arg))
+
+        # remaining args are optional components, dispatched on type
+        for arg in args[1:]:
+            setattr(fclause, _FROM_CLAUSE_SETTERS[type(arg)], arg)
 
         return fclause
 
-    def table_alias(self, args):
-        assert len(args) == 1
-        return args[0]
+    @v_args(inline=True)
+    def table_alias(self, arg):
+        return arg
 
-    def where_clause(self, args):
-        assert len(args) == 1
-        return WhereClause(args[0])
+    @v_args(inline=True)
+    def where_clause(self, arg):
+        return WhereClause(arg)
 
     def group_by_clause(self, args):
         return GroupByClause(args)
 
-    def having_clause(self, args):
-        assert len(args) == 1
-        return HavingClause(args[0])
+    @v_args(inline=True)
+    def having_clause(self, arg):
+        return HavingClause(arg)
 
     def order_by_clause(self, args):
         # assume default ordering: asc
@@ -532,10 +590,10 @@ class ToAst(Transformer):
             assert len(args) == 2
             return LimitClause(*args)
 
-    def source(self, args):
-        assert len(args) == 1
-        # return FromSource(args[0])
-        return args[0]
+    @v_args(inline=True)
+    def source(self, arg):
+        # return FromSource(arg)
+        return arg
 
     def single_source(self, args):
         assert len(args) <= 2
@@ -558,9 +616,9 @@ class ToAst(Transformer):
         assert len(args) == 2
         return UnconditionedJoin(args[0], args[1])
 
-    def expr(self, args) -> Expr:
-        assert len(args) == 1
-        return Expr(args[0])
+    @v_args(inline=True)
+    def expr(self, arg) -> Expr:
+        return Expr(arg)
 
     def condition(self, args):
         if len(args) == 1:
@@ -640,37 +698,30 @@ class ToAst(Transformer):
             raise ValueError("Unexpected arity")
 
     def or_clause(self, args) -> OrClause:
+        # NOTE: the grammar guarantees arity (1 or 2) and operand types;
+        # these run once per logical operator parsed and should stay lean
         if len(args) == 1:
             return args[0]
-        else:
-            assert len(args) == 2
-            ret = OrClause(args)
-            return ret
+        return OrClause(args)
 
     def and_clause(self, args):
         if len(args) == 1:
             return args[0]
-        else:
-            assert len(args) == 2
-            if isinstance(args[0], Comparison):
-                # 1. first time we visit this, both args will be `Comparison` objects
-                assert isinstance(args[1], Comparison)
-                return AndClause(args)
-            else:
-                assert isinstance(args[0], AndClause)
-                assert isinstance(args[1], Comparison)
-                # 2. but subsequent reductions will have args[0] be an AndClause
-                # any other `Condition`s will be attached to this AndClause
-                # NOTE: the parse tree encodes this precedence information via this
-                # nesting; but this is not needed explicitly, rather predicates in the
-                # AndClause will be evaluated left to right by the virtual machine
-                and_clause = args[0]
-                and_clause.append_predicate(args[1])
-                return and_clause
-
-    def primary(self, args):
-        assert len(args) == 1
-        return args[0]
+        first = args[0]
+        if isinstance(first, AndClause):
+            # subsequent reductions will have args[0] be an AndClause;
+            # any other `Condition`s will be attached to this AndClause
+            # NOTE: the parse tree encodes this precedence information via this
+            # nesting; but this is not needed explicitly, rather predicates in the
+            # AndClause will be evaluated left to right by the virtual machine
+            first.append_predicate(args[1])
+            return first
+        # first time we visit this, both args will be `Comparison` objects
+        return AndClause(args)
+
+    @v_args(inline=True)
+    def primary(self, arg):
+        return arg
 
     def literal(self, args):
         if len(args) == 1:
@@ -691,33 +742,26 @@ class ToAst(Transformer):
 
     # create stmnt components
 
-    def table_name(self, args: list):
-        assert len(args) == 1
-        return TableName(args[0])
+    @v_args(inline=True)
+    def table_name(self, arg):
+        return TableName(arg)
 
     def column_def_list(self, args):
         return args
 
-    def column_name(self, args):
-        assert len(args) == 1
-        val = args[0]
-        return ColumnName(val)
+    @v_args(inline=True)
+    def column_name(self, arg):
+        return ColumnName(arg)
 
     def datatype(self, args):
         """
         Convert datatype text to arg
         """
         datatype = args[0].lower()
-        if datatype == "integer":
-            return SymbolicDataType.Integer
-        elif datatype == "real":
-            return SymbolicDataType.Real
-        elif datatype == "text":
-            return SymbolicDataType.Text
-        elif datatype == "blob":
-            return SymbolicDataType.Blob
-        else:
+        symbolic_datatype = _DATATYPE_MAP.get(datatype)
+        if symbolic_datatype is None:
             raise ValueError(f"Unrecognized datatype [{datatype}]")
+        return symbolic_datatype
 
     def primary_key(self, _):
         # this rule doesn't have any children nodes
@@ -12,6 +12,12 @@ class HandlerNotFoundException(Exception):
     pass
 
 
+# cache of symbol class -> handler method name; the name is derived
+# from the class name (regex based case conversion) and hence is fixed
+# per class- compute it once instead of on every visit
+_handler_names = {}
+
+
 class Visitor:
     """
     Conceptually, Visitor is an interface/abstract class,
@@ -30,15 +36,20 @@ class Visitor:
         """
         this will determine which specific handler to invoke; dispatch
         """
-        suffix = camel_to_snake(symbol.__class__.__name__)
+        symbol_class = symbol.__class__
         # determine the name of the handler method from class of expr
         # NB: this requires the class and handler have the
         # same name in PascalCase and snake_case, respectively
-        handler = f"visit_{suffix}"
-        if hasattr(self, handler):
-            return getattr(self, handler)(symbol)
-        else:
-            logging.warning(f"Visitor does not have {handler}")
-            raise HandlerNotFoundException(
-                f"Visitor [{self.__class__.__name__}] does not have {handler}"
-            )
+        handler = _handler_names.get(symbol_class)
+        if handler is None:
+            handler = f"visit_{camel_to_snake(symbol_class.__name__)}"
+            _handler_names[symbol_class] = handler
+        # single attribute probe; hasattr followed by getattr would
+        # resolve the handler twice per dispatch
+        handler_method = getattr(self, handler, None)
+        if handler_method is not None:
+            return handler_method(symbol)
+        logging.warning(f"Visitor does not have {handler}")
+        raise HandlerNotFoundException(
+            f"Visitor [{self.__class__.__name__}] does not have {handler}"
+        )
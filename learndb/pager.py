@@ -58,11 +58,39 @@ class Pager:
             - end of file (by increasing file by a page size)
     """
 
+    __slots__ = (
+        "header",
+        "_slab",
+        "_slab_mv",
+        "_resident",
+        "filename",
+        "fileptr",
+        "fd",
+        "file_length",
+        "num_pages",
+        "num_pages_on_disk",
+        "next_allocatable_page_num",
+        "returned_pages",
+        "has_free_page_list",
+        "free_page_list_head",
+    )
+
     def __init__(self, filename: str):
         self.header = None
-        self.pages = [None for _ in range(TABLE_MAX_PAGES)]
+        # single contiguous slab backing all pages; pages are handed out
+        # as writable memoryview slices of this. One allocation (and one
+        # zero-fill) for the pager's lifetime, and sequentially numbered
+        # pages are adjacent in memory.
+        self._slab = bytearray(TABLE_MAX_PAGES * PAGE_SIZE)
+        self._slab_mv = memoryview(self._slab)
+        # bitmap of which pages are resident (loaded/initialized)
+        self._resident = bytearray(TABLE_MAX_PAGES)
         self.filename = filename
         self.fileptr = None
+        # raw file descriptor of `fileptr`; page reads/writes go through
+        # os.preadv/os.pwrite on this, which address by offset and hence
+        # avoid a seek syscall per page op
+        self.fd = None
         self.file_length = 0
         # num of actual pages
         # at startup, this equals the number of pages on disk; once the pager is running
@@ -126,7 +154,7 @@ class Pager:
         # num_pages counts whole pages
         return page_num < self.num_pages
 
-    def get_page(self, page_num: int) -> bytearray:
+    def get_page(self, page_num: int) -> memoryview:
         """
         get `page` given `page_num`
         """
@@ -135,22 +163,25 @@ class Pager:
                 f"Tried to fetch page out of bounds (requested page = {page_num}, max pages = {TABLE_MAX_PAGES})"
             )
 
-        if self.pages[page_num] is None:
-            # cache miss. Allocate memory and load from file.
-            page = bytearray(PAGE_SIZE)
+        page = self._slab_mv[page_num * PAGE_SIZE : (page_num + 1) * PAGE_SIZE]
+
+        if not self._resident[page_num]:
+            # cache miss; the slab slice is the page's memory- load from
+            # file if the page exists on disk, else hand out as-is
+            # (the slab is zero-initialized)
 
             # determine number of pages in file; there should only be complete pages
             if page_num < self.num_pages:
-                # this page exists on file, load from file
-                # into `page`
-                self.fileptr.seek(FILE_PAGE_AREA_OFFSET + page_num * PAGE_SIZE)
-                read_page = self.fileptr.read(PAGE_SIZE)
+                # this page exists on file; read from file directly
+                # into `page`, i.e. no seek and no intermediate bytes object
+                read_size = os.preadv(
+                    self.fd, [page], FILE_PAGE_AREA_OFFSET + page_num * PAGE_SIZE
+                )
                 assert (
-                    len(read_page) == PAGE_SIZE
+                    read_size == PAGE_SIZE
                 ), "corrupt file: read page returned byte array smaller than page"
-                page[:PAGE_SIZE] = read_page
 
-            self.pages[page_num] = page
+            self._resident[page_num] = 1
 
             if page_num >= self.num_pages:
                 self.num_pages = page_num + 1
@@ -159,7 +190,7 @@ class Pager:
                 # next alloc must be at end of file and monotonically increasing
                 self.next_allocatable_page_num = self.num_pages
 
-        return self.pages[page_num]
+        return page
 
     def return_page(self, page_num: int):
         """
@@ -236,11 +267,22 @@ class Pager:
         self.flush_header()
 
         # 4. flush in-use pages
-        # pages are 0-based
-        for free_page_num in range(self.num_pages):
-            if self.pages[free_page_num] is None:
+        # resident pages are contiguous in the slab; write each maximal
+        # run of resident pages with a single syscall, instead of a
+        # seek+write per page. Typically all pages are resident and this
+        # is one write over the whole page area.
+        page_num = 0
+        while page_num < self.num_pages:
+            if not self._resident[page_num]:
+                page_num += 1
                 continue
-            self.flush_page(free_page_num)
+            run_start = page_num
+            while page_num < self.num_pages and self._resident[page_num]:
+                page_num += 1
+            self.pwrite_all(
+                self._slab_mv[run_start * PAGE_SIZE : page_num * PAGE_SIZE],
+                FILE_PAGE_AREA_OFFSET + run_start * PAGE_SIZE,
+            )
 
         # 5. release exclusive lock on file
         fcntl.lockf(self.fileptr, fcntl.LOCK_UN)
@@ -273,6 +315,7 @@ class Pager:
             # file does not exist
             self.fileptr = open(self.filename, "w+b")
             self.create_file_header()
+        self.fd = self.fileptr.fileno()
         self.file_length = os.path.getsize(self.filename)
 
         # get exclusive lock on file or fail
@@ -306,10 +349,29 @@ class Pager:
         self.next_allocatable_page_num = self.num_pages
 
         # warm up page cache, i.e. load pages into memory
-        # to load data, seek to beginning of file
-        self.fileptr.seek(FILE_HEADER_SIZE)
-        for page_num in range(self.num_pages):
-            self.get_page(page_num)
+        # the on-disk pages are contiguous in the file and in the slab,
+        # so load them all with one bulk read instead of a read per page
+        if self.num_pages > 0:
+            # advise the kernel we're about to read the page area
+            # sequentially, so it ramps up readahead for the bulk read.
+            # this is purely a hint, and not every supported platform
+            # exposes it (macos lacks posix_fadvise)- skip where absent
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(
+                    self.fd,
+                    FILE_PAGE_AREA_OFFSET,
+                    self.num_pages * PAGE_SIZE,
+                    os.POSIX_FADV_SEQUENTIAL,
+                )
+            read_size = os.preadv(
+                self.fd,
+                [self._slab_mv[: self.num_pages * PAGE_SIZE]],
+                FILE_PAGE_AREA_OFFSET,
+            )
+            assert (
+                read_size == self.num_pages * PAGE_SIZE
+            ), "corrupt file: page area smaller than expected"
+            self._resident[: self.num_pages] = b"\x01" * self.num_pages
 
     def create_file_header(self):
         """
@@ -445,15 +507,27 @@ class Pager:
             + FILE_HEADER_NEXT_FREE_PAGE_HEAD_SIZE
         ] = value
 
+    def pwrite_all(self, buffer, offset: int):
+        """
+        write all of `buffer` to file at byte `offset`; pwrite may write
+        fewer bytes than requested (e.g. when interrupted by a signal),
+        so retry with the remainder until the buffer is fully written
+        """
+        view = memoryview(buffer)
+        while len(view):
+            written = os.pwrite(self.fd, view, offset)
+            view = view[written:]
+            offset += written
+
     def flush_header(self):
         """
         Flush file header
         :return:
         """
-        byte_offset = FILE_HEADER_OFFSET
-        self.fileptr.seek(byte_offset)
-        to_write = self.header
-        self.fileptr.write(to_write)
+        # NOTE: this must also go through the raw fd; otherwise the write
+        # sits in `fileptr`'s buffer until close and lands after (and
+        # potentially over) page writes issued via os.pwrite
+        self.pwrite_all(self.header, FILE_HEADER_OFFSET)
 
     def flush_page(self, page_num: int):
         """
@@ -461,11 +535,10 @@ class Pager:
         page_num is the page to write
         size is the number of bytes to write
         """
-        if self.pages[page_num] is None:
+        if not self._resident[page_num]:
             logging.error("Tried to flush null page")
             sys.exit(EXIT_FAILURE)
 
         byte_offset = FILE_PAGE_AREA_OFFSET + page_num * PAGE_SIZE
-        self.fileptr.seek(byte_offset)
-        to_write = self.pages[page_num]
-        self.fileptr.write(to_write)
+        to_write = self._slab_mv[page_num * PAGE_SIZE : (page_num + 1) * PAGE_SIZE]
+        self.pwrite_all(to_write, byte_offset)
@@ -31,6 +31,9 @@ class AbstractRecord:
     TODO: Consider formalizing the interface using abc.ABCMeta; see: https://realpython.com/python-interface/
     """
 
+    # no fields of its own; empty slots keeps subclasses dict-free
+    __slots__ = ()
+
     def get(self, column: str):
         raise NotImplementedError
 
@@ -46,6 +49,10 @@ class SimpleRecord(AbstractRecord):
     # if the returned pipe allows
     """
 
+    # records are allocated per row materialized; slots drop the
+    # per-instance dict and make attribute access a fixed offset
+    __slots__ = ("values", "schema")
+
     def __init__(self, values: dict = None, schema: SimpleSchema = None):
         # unordered mapping from: column-name -> column-value
         self.values = values
@@ -66,8 +73,9 @@ class SimpleRecord(AbstractRecord):
         Create a copy of internal record dict and return
         :return:
         """
-        # return a copy of internal dict
-        return {key: value for key, value in self.values.items()}
+        # return a copy of internal dict; dict() copies at C speed,
+        # without iterating the items pairwise in the interpreter
+        return dict(self.values)
 
     def get(self, column: str):
         """
@@ -110,6 +118,8 @@ class ScopedRecord(AbstractRecord):
     These could be use generated from a single record, or a joining of multiple records.
     """
 
+    __slots__ = ("names", "schema")
+
     # TODO: this should handle init records as two simple records, or a simple and JoinedRecord
     # for a joinedRecord, it should determine be able to flatten and store it
     # think through how this will generalize
@@ -216,6 +226,8 @@ class GroupedRecord(AbstractRecord):
     suffix since it implements the Record interface.
     """
 
+    __slots__ = ("schema", "group_key", "group_recordset")
+
     def __init__(
         self,
         schema: GroupedSchema,
@@ -83,6 +83,10 @@ class SimpleSchema(AbstractSchema):
         self.name = name
         # list of column objects ordered by definition order
         self.cols = columns
+        # lazily built (lowered) column name -> Column mapping; schemas
+        # are read-only once constructed (see note above) so the index
+        # cannot go stale
+        self._column_index = None
 
     @property
     def columns(self):
@@ -106,11 +110,14 @@ class SimpleSchema(AbstractSchema):
         return None
 
     def get_column_by_name(self, name) -> Optional[Column]:
-        name = name.lower()
-        for column in self.columns:
-            if column.name.lower() == name:
-                return column
-        return None
+        # resolve via a name-keyed dict, built in a single pass on first
+        # use, instead of a linear scan (plus a lower() per column) per call
+        index = self._column_index
+        if index is None:
+            index = self._column_index = {
+                column.name.lower(): column for column in self.columns
+            }
+        return index.get(name.lower())
 
     def has_column(self, name: str) -> bool:
         """
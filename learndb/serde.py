@@ -65,6 +65,14 @@ def datatype_to_serialtype(datatype: DataType) -> SerialType:
         return SerialType.Blob
 
 
+# serial-type codes in their encoded form, precomputed once;
+# serialize_record writes one per column of every record, always drawn
+# from this fixed set of five values
+_encoded_serial_types = {
+    serial_type: Integer.serialize(serial_type.value) for serial_type in SerialType
+}
+
+
 def serialize_record(record: SimpleRecord) -> Response:
     """
     Serialize an entire record and return the bytes corresponding
@@ -101,8 +109,10 @@ def serialize_record(record: SimpleRecord) -> Response:
     """
     # encode columns in definition order
     key = b""
-    data_header = b""
-    data = b""
+    # accumulate chunks in lists and join once; appending to a `bytes`
+    # reallocates and copies the full buffer on every concatenation
+    data_header_parts = []
+    data_parts = []
     # 1. encode chunks of payload
     for column in record.schema.columns:
         # get column value
@@ -126,9 +136,7 @@ def serialize_record(record: SimpleRecord) -> Response:
                 )
 
             if value is None:
-                serial_type = SerialType.Null
-                serialized_serial_type = Integer.serialize(serial_type.value)
-                data_header += serialized_serial_type
+                data_header_parts.append(_encoded_serial_types[SerialType.Null])
             else:
                 serial_type = datatype_to_serialtype(column.datatype)
                 # all columns except null can be serialized;
@@ -138,33 +146,34 @@ def serialize_record(record: SimpleRecord) -> Response:
                 ), f"non-null unserializable column [{column.name}]"
 
                 # serialize header
-                serialized_serial_type = Integer.serialize(serial_type.value)
-                data_header += serialized_serial_type
+                data_header_parts.append(_encoded_serial_types[serial_type])
 
                 # serialize data
                 serialized_value = column.datatype.serialize(value)
-                data += serialized_value
+                data_parts.append(serialized_value)
 
                 # check if datatype is variable length
                 if not column.datatype.is_fixed_length:
                     length = Integer.serialize(len(serialized_value))
                     # encode length in header
-                    data_header += length
+                    data_header_parts.append(length)
 
     # data-header is defined like:
     # [size of header, serial types (size of variable length value)? ]
     # NOTE: the data header, size of header includes self
+    data_header = b"".join(data_header_parts)
+    data = b"".join(data_parts)
     data_header_len = Integer.serialize(Integer.fixed_length + len(data_header))
-    data_header = data_header_len + data_header
 
     # 2. assemble chunks as per file format spec into a cell
     # i.e. cell = [key_size(4B), data_size(4B), key(var), data-header(var), data(var) ]
+    # join all the chunks at once- pairwise concatenation would allocate
+    # (and copy into) an intermediate buffer per `+`
     key_size = Integer.serialize(len(key))
-    data_payload = data_header + data
-    data_size = Integer.serialize(len(data_payload))
+    data_size = Integer.serialize(Integer.fixed_length + len(data_header) + len(data))
     # print(f'In serialize; key-size: {key_size}, data-header-len: {data_header_len}, data_size: {data_size}')
     # print(cell)
-    cell = key_size + data_size + key + data_payload
+    cell = b"".join((key_size, data_size, key, data_header_len, data_header, data))
     return Response(True, body=cell)
 
 
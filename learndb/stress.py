@@ -13,6 +13,11 @@ import math
 
 from .constants import EXIT_SUCCESS
 
+# whether to print the tree after each mutation; print_tree walks (and
+# prints) the entire tree, i.e. O(N) per op, which dominates the suite's
+# runtime- enable only when debugging a failing case
+DEBUG_TREE = False
+
 
 def run_add_del_stress_test(db, insert_keys, del_keys):
     """
@@ -39,8 +44,9 @@ def run_add_del_stress_test(db, insert_keys, del_keys):
         logging.info(f"handling [{cmd}]")
         resp = db.handle_input(cmd)
 
-    logging.debug("printing tree.......................")
-    db.state_manager.print_tree("foo")
+    if DEBUG_TREE:
+        logging.debug("printing tree.......................")
+        db.state_manager.print_tree("foo")
 
     # delete and validate
     for idx, key in enumerate(del_keys):
@@ -69,8 +75,9 @@ def run_add_del_stress_test(db, insert_keys, del_keys):
 
         # assert result_keys == [k for k in sorted(keys)], f"result {result_keys} doesn't not match {[k for k in sorted(keys)]}"
 
-        logging.debug("printing tree.......................")
-        db.state_manager.print_tree("foo")
+        if DEBUG_TREE:
+            logging.debug("printing tree.......................")
+            db.state_manager.print_tree("foo")
         # ensure tree is valid
         db.state_manager.validate_tree("foo")
 